@@ -4,13 +4,95 @@ TBX to Excel Converter
 Converts TermBase eXchange (.tbx) files to Excel (.xlsx) format with columnar structure
 """
 
-import xml.etree.ElementTree as ET
-import pandas as pd
+try:
+    # lxml's C parser is substantially faster on large files
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 import argparse
+import logging
+import os
+import re
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from collections import defaultdict
+from functools import lru_cache, partial
+from itertools import chain, islice
+
+
+logger = logging.getLogger(__name__)
+
+# Splits output column names into language prefix, field and optional term number
+# (e.g. "de_term_2" -> "de", "term", "2")
+_COLUMN_NAME_PATTERN = re.compile(r'^([^_]+)_(.+?)(?:_(\d+))?$')
+
+# Lower-cased local names of language group and term group elements
+_LANG_GROUP_TAGS = frozenset({'langset', 'langgrp'})
+_TERM_GROUP_TAGS = frozenset({'tig', 'termgrp'})
+
+# Clark-notation name of the xml:lang attribute
+_XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+# Size limits of an Excel worksheet
+_EXCEL_MAX_ROWS = 1048576
+_EXCEL_MAX_COLUMNS = 16384
+
+
+@lru_cache(maxsize=256)
+def _lower(tag: str) -> str:
+    """
+    Return an element tag without its '{namespace}' prefix, lower-cased
+    
+    TBX files only use a few dozen distinct tags, so the result is cached
+    instead of being recomputed for every element, and interned so that
+    comparisons against tag name literals are pointer compares.
+    Comments and processing instructions (whose tag is not a string under
+    lxml) get an empty name.
+    """
+    if not isinstance(tag, str):
+        return ''
+    return sys.intern(tag.rpartition('}')[2].lower())
+
+
+def _set_value(values: List[str], row_idx: int, value: str) -> None:
+    """
+    Set the value of one row in a column list
+    
+    Columns are only extended up to the rows that have a value; rows
+    skipped since the last value (including every earlier row of a newly
+    seen column) are filled with empty values.
+    """
+    missing = row_idx - len(values)
+    if missing > 0:
+        values.extend([''] * missing)
+    if missing >= 0:
+        values.append(value)
+    else:
+        values[row_idx] = value
+
+
+if HAS_LXML:
+    # lxml walks the tree in C
+    _iterwalk = partial(ET.iterwalk, events=('start', 'end'))
+else:
+    def _iterwalk(elem: ET.Element):
+        """
+        Walk an element tree depth-first, yielding ('start', element) and
+        ('end', element) events like lxml's etree.iterwalk
+        """
+        yield 'start', elem
+        stack = [(elem, iter(elem))]
+        while stack:
+            parent, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                yield 'end', parent
+            else:
+                yield 'start', child
+                stack.append((child, iter(child)))
 
 
 class TBXConverter:
@@ -22,74 +104,112 @@ class TBXConverter:
             tbx_file_path (str): Path to the TBX file
         """
         self.tbx_file_path = Path(tbx_file_path)
-        self.namespace = {}
-        self.terms_data = []
-        self.entries_data = {}  # Store entries grouped by entry_id
+        self._columns = {}  # Maps column names to their values, one per row
+        self._nrows = 0
+        self._entry_rows = {}  # Maps entry IDs to their row index
+        self.languages_seen = []  # Languages with terms, in order of first appearance
         self.available_fields = set()
         self.selected_fields = []
         self.field_mappings = {}  # Maps original field names to user-chosen names
+        self._selected_set = frozenset()
+        self._note_fields = {}  # Maps termNote types to selected field names
+        self._descrip_fields = {}  # Maps descrip types to selected field names
+        self._entry_descrip_fields = {}  # Maps entry-level descrip types to selected field names
+        self._entry_fields = []  # Selected entry-level output fields
+        self._term_fields = []  # Selected term-level output fields
+        self._field_plan = {}  # Maps fields filled from term groups to their position in a term row
+        self._language_index = None  # Position of the language in a term row, if selected
+        self._entry_stream = None  # termEntry stream left open by the field scan
+        self._entry_cache = []  # Entries already read from the stream by the field scan
+        
+    def _iter_term_entries(self):
+        """
+        Stream termEntry elements from the TBX file one at a time
+        
+        Each entry is detached from its parent once the caller moves on to the
+        next one, and callers clear entries they are done with, so memory use
+        stays bounded by the entries still in use rather than the file size.
         
+        Yields:
+            termEntry XML elements
+        """
+        if HAS_LXML:
+            # Only end events are needed here. iterparse's tag= filter would
+            # match case-sensitively, so a termEntry is recognised through
+            # _lower as in the stdlib branch, in any namespace and letter case
+            for event, elem in ET.iterparse(str(self.tbx_file_path), events=('end',)):
+                if _lower(elem.tag) != 'termentry':
+                    continue
+                yield elem
+                
+                # Prune the entries processed so far so the tree does not keep growing
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            return
+        
+        parents = []  # Currently open elements
+        for event, elem in ET.iterparse(str(self.tbx_file_path), events=('start', 'end')):
+            if event == 'start':
+                parents.append(elem)
+                continue
+            
+            parents.pop()
+            if _lower(elem.tag) == 'termentry':
+                yield elem
+                
+                # Prune the processed entry so the tree does not keep growing
+                if parents:
+                    parents[-1].remove(elem)
+    
     def _scan_available_fields(self) -> None:
         """Scan the TBX file to identify all available data fields"""
-        print("Scanning TBX file to identify available data fields...")
+        logger.info("Scanning TBX file to identify available data fields...")
         
         try:
-            tree = ET.parse(self.tbx_file_path)
-            root = tree.getroot()
-            
-            # Register namespaces
-            self._register_namespaces(root)
-            
-            # Find all termEntry elements
-            term_entries = root.findall('.//termEntry')
-            if not term_entries and 'default' in self.namespace:
-                term_entries = root.findall(f'.//{self.namespace["default"]}termEntry')
-            
-            # If still not found, try without namespace prefix
-            if not term_entries:
-                for elem in root.iter():
-                    if 'termentry' in elem.tag.lower():
-                        term_entries.append(elem)
-            
-            # Scan through all entries to find available fields
-            for entry in term_entries[:3]:  # Sample first 3 entries for performance
-                # Find language groups (langSet or langGrp)
-                lang_groups = []
-                lang_groups.extend(entry.findall('.//langSet'))
-                lang_groups.extend(entry.findall('.//langGrp'))
-                
-                for lang_grp in lang_groups:
-                    # Find term groups (tig or termGrp)
-                    term_groups = []
-                    term_groups.extend(lang_grp.findall('.//tig'))
-                    term_groups.extend(lang_grp.findall('.//termGrp'))
+            # Sample the first 3 entries for performance. They are kept, together
+            # with the open stream, so parse_tbx can continue from here instead
+            # of parsing the file a second time.
+            self._entry_stream = self._iter_term_entries()
+            self._entry_cache = list(islice(self._entry_stream, 3))
+            
+            for entry in self._entry_cache:
+                # Walk the entry once, tracking whether we are inside a language
+                # group (langSet or langGrp) and a term group (tig or termGrp)
+                lang_depth = 0
+                term_depth = 0
+                for event, elem in _iterwalk(entry):
+                    tag_name = _lower(elem.tag)
+                    if tag_name in _LANG_GROUP_TAGS:
+                        lang_depth += 1 if event == 'start' else -1
+                    elif tag_name in _TERM_GROUP_TAGS:
+                        term_depth += 1 if event == 'start' else -1
+                    elif event == 'start':
+                        continue
                     
-                    for term_grp in term_groups:
-                        # Scan all child elements
-                        for elem in term_grp.iter():
-                            tag_name = elem.tag.lower()
-                            
-                            # Always include the basic term
-                            if tag_name == 'term':
-                                self.available_fields.add('term')
-                            
-                            # Include termNote elements with their types
-                            elif 'note' in tag_name:
-                                note_type = elem.get('type', 'note')
-                                self.available_fields.add(f"termNote_{note_type}")
-                            
-                            # Include descrip elements with their types
-                            elif 'descrip' in tag_name:
-                                descrip_type = elem.get('type', 'description')
-                                self.available_fields.add(f"descrip_{descrip_type}")
-                            
-                            # Include other relevant elements
-                            elif tag_name in ['definition', 'context', 'example', 'note']:
-                                self.available_fields.add(tag_name)
-                
-                # Also check entry-level descriptions
-                for elem in entry.iter():
-                    if 'descrip' in elem.tag.lower():
+                    elif term_depth:
+                        if not lang_depth:
+                            continue
+                        
+                        # Always include the basic term
+                        if tag_name == 'term':
+                            self.available_fields.add('term')
+                        
+                        # Include termNote elements with their types
+                        elif 'note' in tag_name:
+                            note_type = elem.get('type', 'note')
+                            self.available_fields.add(f"termNote_{note_type}")
+                        
+                        # Include descrip elements with their types
+                        elif 'descrip' in tag_name:
+                            descrip_type = elem.get('type', 'description')
+                            self.available_fields.add(f"descrip_{descrip_type}")
+                        
+                        # Include other relevant elements
+                        elif tag_name in ['definition', 'context', 'example', 'note']:
+                            self.available_fields.add(tag_name)
+                    
+                    # Entry-level descriptions are those outside any tig/termGrp
+                    elif 'descrip' in tag_name:
                         descrip_type = elem.get('type', 'description')
                         self.available_fields.add(f"entry_descrip_{descrip_type}")
             
@@ -97,7 +217,10 @@ class TBXConverter:
             self.available_fields.update(['entry_id', 'language', 'term'])
             
         except Exception as e:
-            print(f"Error scanning file: {e}")
+            logger.error("Error scanning file: %s", e)
+            # Let parse_tbx start over and report the problem itself
+            self._entry_stream = None
+            self._entry_cache = []
             # Add some default fields as fallback
             self.available_fields.update([
                 'entry_id', 'language', 'term', 'termNote_status', 
@@ -109,13 +232,13 @@ class TBXConverter:
         if not self.available_fields:
             self._scan_available_fields()
         
-        sorted_fields = sorted(list(self.available_fields))
+        sorted_fields = sorted(self.available_fields)
         
         print(f"\nFound {len(sorted_fields)} available data fields in your TBX file:")
         print("=" * 60)
         
-        for i, field in enumerate(sorted_fields, 1):
-            print(f"{i:2d}. {field}")
+        # Write the listing in one go rather than one line at a time
+        print('\n'.join(f"{i:2d}. {field}" for i, field in enumerate(sorted_fields, 1)))
         
         print("\nWhich fields would you like to include in the Excel output?")
         print("Enter the numbers separated by commas (e.g., 1,3,5,7) or type 'all' for all fields:")
@@ -145,8 +268,7 @@ class TBXConverter:
                 print("Invalid input. Please enter numbers separated by commas or type 'all'")
         
         print(f"\nSelected {len(self.selected_fields)} fields:")
-        for field in self.selected_fields:
-            print(f"  - {field}")
+        print('\n'.join(f"  - {field}" for field in self.selected_fields))
     
     def _interactive_field_renaming(self) -> None:
         """Interactive field renaming by user"""
@@ -196,11 +318,10 @@ class TBXConverter:
                 print(f"  Keeping '{field}'")
         
         print(f"\nFinal column mappings:")
-        for original, new in self.field_mappings.items():
-            if original != new:
-                print(f"  '{original}' → '{new}'")
-            else:
-                print(f"  '{original}' (unchanged)")
+        print('\n'.join(
+            f"  '{original}' → '{new}'" if original != new else f"  '{original}' (unchanged)"
+            for original, new in self.field_mappings.items()
+        ))
     
     def configure_extraction(self) -> None:
         """Run the interactive configuration process"""
@@ -215,401 +336,385 @@ class TBXConverter:
         print(f"Ready to extract {len(self.selected_fields)} fields from your TBX file.")
         print("=" * 60)
         
-    def _register_namespaces(self, root: ET.Element) -> None:
-        """Register XML namespaces found in the document"""
-        # Common TBX namespaces
-        common_namespaces = {
-            '': 'http://www.lisa.org/TBX-Specification.33.0.html',
-            'xml': 'http://www.w3.org/XML/1998/namespace',
-            'xlink': 'http://www.w3.org/1999/xlink'
+    def _prepare_field_lookups(self) -> None:
+        """Precompute membership and type lookups for the selected fields"""
+        self._selected_set = frozenset(self.selected_fields)
+        self._note_fields = {
+            field[len('termNote_'):]: field
+            for field in self.selected_fields if field.startswith('termNote_')
         }
-        
-        # Extract namespaces from root element
-        for prefix, uri in root.attrib.items():
-            if prefix.startswith('xmlns'):
-                ns_prefix = prefix[6:] if prefix.startswith('xmlns:') else ''
-                common_namespaces[ns_prefix] = uri
-                
-        # Register namespaces
-        for prefix, uri in common_namespaces.items():
-            if prefix:
-                ET.register_namespace(prefix, uri)
-                self.namespace[prefix] = f"{{{uri}}}"
-            else:
-                self.namespace['default'] = f"{{{uri}}}"
+        self._descrip_fields = {
+            field[len('descrip_'):]: field
+            for field in self.selected_fields if field.startswith('descrip_')
+        }
+        self._entry_descrip_fields = {
+            field[len('entry_descrip_'):]: field
+            for field in self.selected_fields if field.startswith('entry_descrip_')
+        }
+        # Output fields in column order, split into entry-level and term-level ones
+        self._entry_fields = [field for field in self.selected_fields
+                              if field.startswith('entry_') and field != 'entry_id']
+        self._term_fields = [field for field in self.selected_fields
+                             if not field.startswith('entry_') and field != 'entry_id']
+        # Terms are stored as lists in _term_fields order, so they line up with
+        # their output columns. The language comes from the language group, the
+        # other fields from the elements of the term group.
+        self._field_plan = {
+            field: i for i, field in enumerate(self._term_fields) if field != 'language'
+        }
+        self._language_index = (self._term_fields.index('language')
+                                if 'language' in self._term_fields else None)
     
-    def _extract_term_info(self, lang_grp: ET.Element) -> Dict[str, Any]:
+    def _extract_entry_info(self, entry: ET.Element, entry_id: str) -> Dict[str, Any]:
         """
-        Extract term information from a langGrp/langSet element
+        Extract entry-level fields and the terms of every language from a termEntry
+        
+        The entry is walked once with start/end events: langSet/langGrp and
+        tig/termGrp elements open and close the current language and term
+        groups, and descrip elements outside any term group are entry-level.
         
         Args:
-            lang_grp: langGrp/langSet XML element
+            entry: termEntry XML element
+            entry_id: Identifier of the entry
             
         Returns:
-            Dictionary containing term information
+            Dictionary containing the entry data, with each term as a list
+            of values in _term_fields order
         """
-        term_info = {}
-        
-        # Get language code - try multiple attributes
-        lang_code = (lang_grp.get('xml:lang') or 
-                    lang_grp.get('lang') or 
-                    lang_grp.get('{http://www.w3.org/XML/1998/namespace}lang', ''))
-        term_info['language'] = lang_code
-        
-        print(f"  Processing language group: {lang_code}")
-        
-        # Find termGrp or tig elements - try multiple approaches
-        term_groups = []
-        
-        # Direct search for tig (which your file uses)
-        term_groups.extend(lang_grp.findall('.//tig'))
-        term_groups.extend(lang_grp.findall('tig'))
-        
-        # Also try termGrp for other TBX variants
-        term_groups.extend(lang_grp.findall('.//termGrp'))
-        term_groups.extend(lang_grp.findall('termGrp'))
-        
-        # Try with various namespaces
-        for ns_prefix, ns_uri in self.namespace.items():
-            if ns_prefix != 'default':
-                continue
-            term_groups.extend(lang_grp.findall(f'.//{ns_uri}tig'))
-            term_groups.extend(lang_grp.findall(f'.//{ns_uri}termGrp'))
-        
-        # Remove duplicates
-        term_groups = list({id(tg): tg for tg in term_groups}.values())
-        
-        print(f"    Found {len(term_groups)} term groups")
+        selected = self._selected_set
+        note_fields = self._note_fields
+        descrip_fields = self._descrip_fields
+        entry_descrip_fields = self._entry_descrip_fields
+        field_plan = self._field_plan
+        language_index = self._language_index
+        nfields = len(self._term_fields)
+        intern = sys.intern
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        entry_data = {
+            'entry_id': entry_id,
+            'languages': {}  # Will store language -> [terms] mapping
+        }
+        lang_count = 0
         
+        lang_grp = None  # Current langSet/langGrp element
+        lang_code = ''
         terms = []
         seen_terms = set()  # To avoid duplicate terms
         
-        for term_grp in term_groups:
-            # Initialize term data with all selected fields
-            term_data = {field: '' for field in self.selected_fields if field != 'entry_id'}
-            term_data['language'] = lang_code
+        term_grp = None  # Current tig/termGrp element
+        term_text = None
+        term_row = None
+        remaining = {}  # Row positions of the term-level fields not yet filled in term_row
+        
+        for event, elem in _iterwalk(entry):
+            tag_name = _lower(elem.tag)
             
-            # Extract term text - try multiple approaches
-            term_elem = None
+            if event == 'start':
+                if lang_grp is None:
+                    if tag_name in _LANG_GROUP_TAGS or (
+                            'lang' in tag_name and ('grp' in tag_name or 'set' in tag_name)):
+                        lang_grp = elem
+                        lang_count += 1
+                        
+                        # Get language code - try multiple attributes
+                        lang_code = intern(elem.get('xml:lang') or 
+                                           elem.get('lang') or 
+                                           elem.get(_XML_LANG, ''))
+                        terms = []
+                        seen_terms = set()
+                        if debug:
+                            logger.debug("  Processing language group: %s", lang_code)
+                
+                elif term_grp is None and tag_name in _TERM_GROUP_TAGS:
+                    term_grp = elem
+                    term_text = None
+                    
+                    # Initialize term data with all selected fields
+                    term_row = [''] * nfields
+                    if language_index is not None:
+                        term_row[language_index] = lang_code
+                    remaining = field_plan.copy()
+                continue
             
-            # Direct search
-            term_elem = term_grp.find('.//term')
-            if term_elem is None:
-                term_elem = term_grp.find('term')
+            if elem is term_grp:
+                term_grp = None
+                if term_text is None:
+                    if debug:
+                        logger.debug("      Warning: No term element found in term group")
+                
+                # Skip duplicate terms
+                elif term_text not in seen_terms:
+                    seen_terms.add(term_text)
+                    if debug:
+                        logger.debug("      Found term: '%s'", term_text)
+                    terms.append(term_row)
+                continue
             
-            # Try with namespace
-            if term_elem is None and 'default' in self.namespace:
-                term_elem = term_grp.find(f'.//{self.namespace["default"]}term')
+            if elem is lang_grp:
+                lang_grp = None
+                if debug:
+                    logger.debug("    Found %d terms", len(terms))
+                if lang_code and terms:
+                    entry_data['languages'][lang_code] = terms
+                continue
             
-            # If still not found, look for any element with 'term' in the name
-            if term_elem is None:
-                for child in term_grp.iter():
-                    if 'term' in child.tag.lower():
-                        term_elem = child
-                        break
+            # Nothing left to extract from the rest of this term group
+            if term_grp is not None and not remaining and term_text is not None:
+                continue
             
-            if term_elem is not None:
-                term_text = (term_elem.text or '').strip()
-                
-                # Skip empty terms or duplicates
-                if not term_text or term_text in seen_terms:
-                    continue
-                
-                seen_terms.add(term_text)
-                print(f"      Found term: '{term_text}'")
-                
-                if 'term' in self.selected_fields:
-                    term_data['term'] = term_text
-                
-                # Extract data for all selected fields
-                for elem in term_grp.iter():
-                    tag_name = elem.tag.lower()
-                    elem_text = (elem.text or '').strip()
-                    
-                    if not elem_text:  # Skip empty elements
-                        continue
-                    
-                    # Handle termNote elements
-                    if 'note' in tag_name:
-                        note_type = elem.get('type', 'note')
-                        field_name = f"termNote_{note_type}"
-                        if field_name in self.selected_fields:
-                            term_data[field_name] = elem_text
-                    
-                    # Handle descrip elements  
-                    elif 'descrip' in tag_name:
-                        descrip_type = elem.get('type', 'description')
-                        field_name = f"descrip_{descrip_type}"
-                        if field_name in self.selected_fields:
-                            term_data[field_name] = elem_text
-                    
-                    # Handle other elements
-                    elif tag_name in self.selected_fields:
-                        term_data[tag_name] = elem_text
-                        
-                terms.append(term_data)
+            elem_text = (elem.text or '').strip()
+            if not elem_text:  # Skip empty elements
+                continue
+            
+            if term_grp is None:
+                # Entry-level description fields
+                if 'descrip' in tag_name:
+                    field_name = entry_descrip_fields.get(elem.get('type', 'description'))
+                    if field_name:
+                        entry_data[field_name] = elem_text
+                elif 'subject' in tag_name:
+                    if 'entry_subject' in selected:
+                        entry_data['entry_subject'] = elem_text
+            
+            elif tag_name == 'term':
+                if term_text is None:
+                    term_text = elem_text
+                idx = remaining.pop('term', None)
+                if idx is not None:
+                    term_row[idx] = elem_text
+            
+            # Handle termNote elements
+            elif 'note' in tag_name:
+                idx = remaining.pop(note_fields.get(elem.get('type', 'note')), None)
+                if idx is not None:
+                    # termNote values are mostly picklist values (partOfSpeech,
+                    # termType, ...), so share one string per distinct value
+                    term_row[idx] = intern(elem_text)
+            
+            # Handle descrip elements
+            elif 'descrip' in tag_name:
+                idx = remaining.pop(descrip_fields.get(elem.get('type', 'description')), None)
+                if idx is not None:
+                    term_row[idx] = elem_text
+            
+            # Handle other elements
             else:
-                print(f"      Warning: No term element found in term group")
+                idx = remaining.pop(tag_name, None)
+                if idx is not None:
+                    term_row[idx] = elem_text
         
-        term_info['terms'] = terms
-        return term_info
+        logger.debug("  Found %d language groups", lang_count)
+        return entry_data
     
     def parse_tbx(self) -> None:
         """Parse the TBX file and extract terminology data"""
+        self._prepare_field_lookups()
+        self._columns = {}
+        self._nrows = 0
+        self._entry_rows = {}
+        self.languages_seen = []
+        
+        # Column lists per (language, term index), resolved the first time they are needed
+        col_cache = {}
+        
+        extract_entry_info = self._extract_entry_info
+        add_entry_row = self._add_entry_row
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
         try:
-            tree = ET.parse(self.tbx_file_path)
-            root = tree.getroot()
-            
-            print(f"Root element: {root.tag}")
-            
-            # Register namespaces
-            self._register_namespaces(root)
-            print(f"Registered namespaces: {list(self.namespace.keys())}")
-            
-            # Find all termEntry elements
-            term_entries = root.findall('.//termEntry')
-            if not term_entries and 'default' in self.namespace:
-                term_entries = root.findall(f'.//{self.namespace["default"]}termEntry')
+            # Continue from the entries and stream left by the field scan, if any
+            entries = chain(self._entry_cache, self._entry_stream or self._iter_term_entries())
+            self._entry_cache = []
+            self._entry_stream = None
             
-            # If still not found, try without namespace prefix
-            if not term_entries:
-                for elem in root.iter():
-                    if 'termentry' in elem.tag.lower():
-                        term_entries.append(elem)
-            
-            print(f"Found {len(term_entries)} term entries")
-            
-            # Process each entry and store by entry_id
-            for i, entry in enumerate(term_entries, start=1):
+            # Process each entry and write it straight into the output columns
+            for i, entry in enumerate(entries, start=1):
                 entry_id = entry.get('id', f'entry_{i}')
-                print(f"Processing entry {i+1}: {entry_id}")
-                
-                # Initialize entry data
-                entry_data = {
-                    'entry_id': entry_id,
-                    'languages': {}  # Will store language -> [terms] mapping
-                }
-                
-                # Extract entry-level description fields
-                for elem in entry.iter():
-                    if 'descrip' in elem.tag.lower():
-                        descrip_type = elem.get('type', 'description')
-                        field_name = f"entry_descrip_{descrip_type}"
-                        if field_name in self.selected_fields and elem.text and elem.text.strip():
-                            entry_data[field_name] = elem.text.strip()
-                    elif 'subject' in elem.tag.lower():
-                        if 'entry_subject' in self.selected_fields and elem.text and elem.text.strip():
-                            entry_data['entry_subject'] = elem.text.strip()
+                if debug:
+                    logger.debug("Processing entry %d: %s", i, entry_id)
                 
-                # Find language groups
-                lang_groups = []
+                entry_data = extract_entry_info(entry, entry_id)
                 
-                # Try langSet first (which is what your file uses)
-                lang_groups.extend(entry.findall('.//langSet'))
-                lang_groups.extend(entry.findall('langSet'))
-                
-                # Try langGrp
-                if not lang_groups:
-                    lang_groups.extend(entry.findall('.//langGrp'))
-                    lang_groups.extend(entry.findall('langGrp'))
-                
-                # Try with namespace
-                if not lang_groups and 'default' in self.namespace:
-                    lang_groups.extend(entry.findall(f'.//{self.namespace["default"]}langSet'))
-                    lang_groups.extend(entry.findall(f'.//{self.namespace["default"]}langGrp'))
-                
-                # If no standard elements found, look for elements with 'lang' in the name
-                if not lang_groups:
-                    for elem in entry.iter():
-                        if 'lang' in elem.tag.lower() and ('grp' in elem.tag.lower() or 'set' in elem.tag.lower()):
-                            lang_groups.append(elem)
-                
-                print(f"  Found {len(lang_groups)} language groups")
-                
-                # Extract terms for each language
-                for lang_grp in lang_groups:
-                    lang_info = self._extract_term_info(lang_grp)
-                    lang_code = lang_info['language']
-                    if lang_code and lang_info['terms']:
-                        entry_data['languages'][lang_code] = lang_info['terms']
-                
-                print(f"  Languages with terms: {list(entry_data['languages'].keys())}")
+                if debug:
+                    logger.debug("  Languages with terms: %s", list(entry_data['languages']))
+                    if not entry_data['languages']:
+                        logger.debug("  Warning: No terms found for entry %s", entry_id)
                 
                 # Store the entry data
-                self.entries_data[entry_id] = entry_data
+                add_entry_row(entry_data, col_cache)
                 
-                if not entry_data['languages']:
-                    print(f"  Warning: No terms found for entry {entry_id}")
+                # Free the entry's subtree now that its data has been extracted
+                entry.clear()
             
-            print(f"\nTotal entries processed: {len(self.entries_data)}")
+            logger.info("\nTotal entries processed: %d", len(self._entry_rows))
             
-            # Convert entries to flat rows for Excel
-            self._flatten_entries_to_rows()
+            self._finish_rows()
             
-            if not self.terms_data:
-                print("\nDEBUG: Let's examine the structure of your TBX file...")
-                print("Sample elements found:")
-                for i, elem in enumerate(root.iter()):
-                    if i < 20:  # Show first 20 elements
-                        attrs = {k: v for k, v in elem.attrib.items()}
-                        text = elem.text.strip() if elem.text and elem.text.strip() else ""
-                        text = text[:50] + "..." if len(text) > 50 else text
-                        print(f"  {elem.tag}: {attrs} -> '{text}'")
-                    else:
-                        break
+            if not self._nrows:
+                logger.info("\nDEBUG: Let's examine the structure of your TBX file...")
+                logger.info("Sample elements found:")
+                for elem in self._sample_elements(20):  # Show first 20 elements
+                    attrs = {k: v for k, v in elem.attrib.items()}
+                    text = elem.text.strip() if elem.text and elem.text.strip() else ""
+                    text = text[:50] + "..." if len(text) > 50 else text
+                    logger.info("  %s: %s -> '%s'", elem.tag, attrs, text)
                             
         except ET.ParseError as e:
-            print(f"Error parsing XML: {e}")
+            logger.error("Error parsing XML: %s", e)
             sys.exit(1)
         except FileNotFoundError:
-            print(f"File not found: {self.tbx_file_path}")
+            logger.error("File not found: %s", self.tbx_file_path)
             sys.exit(1)
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             sys.exit(1)
     
-    def _flatten_entries_to_rows(self) -> None:
-        """Convert the structured entries data into flat rows for Excel"""
-        print("\nFlattening entries into Excel rows...")
-        
-        self.terms_data = []
+    def _sample_elements(self, limit: int) -> List[ET.Element]:
+        """Return the first elements of the TBX file in document order, for debugging"""
+        sample = []
+        for event, elem in ET.iterparse(str(self.tbx_file_path), events=('start',)):
+            # Stop at the next start tag so the text of the last sampled element is complete
+            if len(sample) == limit:
+                break
+            sample.append(elem)
+        return sample
+    
+    def _add_entry_row(self, entry_data: Dict[str, Any], col_cache: Dict) -> None:
+        """
+        Write the data of one entry into its row of the output columns
         
-        for entry_id, entry_data in self.entries_data.items():
-            print(f"Processing entry: {entry_id}")
-            
-            # Start with entry-level data
-            row = {}
-            
-            # Add entry ID if selected
-            if 'entry_id' in self.selected_fields:
-                row['entry_id'] = entry_id
-            
-            # Add entry-level description fields
-            for field in self.selected_fields:
-                if field.startswith('entry_') and field != 'entry_id':
-                    if field in entry_data:
-                        row[field] = entry_data[field]
+        Args:
+            entry_data: Entry data as returned by _extract_entry_info
+            col_cache: Column lists per (language, term index), shared across entries
+        """
+        entry_id = entry_data['entry_id']
+        row_idx = self._entry_rows.get(entry_id)
+        if row_idx is None:
+            row_idx = self._entry_rows[entry_id] = len(self._entry_rows)
+        else:
+            # A later entry with the same ID replaces the earlier one
+            for values in self._columns.values():
+                if len(values) > row_idx:
+                    values[row_idx] = ''
+        
+        # Start with entry-level data: the entry ID if selected
+        if 'entry_id' in self._selected_set:
+            _set_value(self._get_column('entry_id'), row_idx, entry_id)
+        
+        # Add entry-level description fields
+        for field in self._entry_fields:
+            _set_value(self._get_column(field), row_idx, entry_data.get(field, ''))
+        
+        # Process languages and their terms
+        languages = entry_data['languages']
+        
+        if languages and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Terms per language: %s",
+                         {lang_code: len(terms) for lang_code, terms in languages.items()})
+        
+        # Add columns for each language and term combination
+        term_fields = self._term_fields
+        for lang_code, terms in languages.items():
+            for term_idx, term_row in enumerate(terms):
+                col_lists = col_cache.get((lang_code, term_idx))
+                if col_lists is None:
+                    # Create column names: language_field or language_field_2, language_field_3, etc.
+                    if term_idx == 0:
+                        self.languages_seen.append(lang_code)
+                        col_names = [f"{lang_code}_{field}" for field in term_fields]
                     else:
-                        row[field] = ''
-            
-            # Process languages and their terms
-            languages = entry_data['languages']
-            
-            if not languages:
-                # Entry with no terms - still add the row with entry-level data
-                self.terms_data.append(row)
-                continue
-            
-            # For each language, find the maximum number of terms
-            max_terms_per_lang = {}
-            for lang_code, terms in languages.items():
-                max_terms_per_lang[lang_code] = len(terms)
-            
-            print(f"  Languages: {list(languages.keys())}")
-            print(f"  Terms per language: {max_terms_per_lang}")
-            
-            # Add columns for each language and term combination
-            for lang_code, terms in languages.items():
-                for term_idx, term_data in enumerate(terms):
-                    # For each selected field (except entry-level ones)
-                    for field in self.selected_fields:
-                        if field.startswith('entry_') or field == 'entry_id':
-                            continue  # Skip entry-level fields, already handled
-                        
-                        # Create column name: language_field or language_field_1, language_field_2, etc.
-                        if term_idx == 0:
-                            col_name = f"{lang_code}_{field}"
-                        else:
-                            col_name = f"{lang_code}_{field}_{term_idx + 1}"
-                        
-                        # Get the value for this field
-                        value = term_data.get(field, '')
-                        row[col_name] = value
-            
-            # Add the completed row
-            self.terms_data.append(row)
-            print(f"  Created row with {len(row)} columns")
+                        col_names = [f"{lang_code}_{field}_{term_idx + 1}" for field in term_fields]
+                    col_lists = [self._get_column(col_name) for col_name in col_names]
+                    col_cache[(lang_code, term_idx)] = col_lists
+                
+                # For each selected field (except entry-level ones); columns
+                # that already reach this row are simply appended to
+                for value, values in zip(term_row, col_lists):
+                    if len(values) == row_idx:
+                        values.append(value)
+                    else:
+                        _set_value(values, row_idx, value)
+    
+    def _finish_rows(self) -> None:
+        """Pad every output column to the full number of rows"""
+        self._nrows = nrows = len(self._entry_rows)
+        for values in self._columns.values():
+            if len(values) < nrows:
+                values.extend([''] * (nrows - len(values)))
         
-        print(f"\nTotal rows created: {len(self.terms_data)}")
+        logger.info("\nTotal rows created: %d", self._nrows)
         
         # Show column structure
-        if self.terms_data:
-            sample_row = self.terms_data[0]
-            print(f"Sample columns ({len(sample_row)}):")
-            for i, col_name in enumerate(sorted(sample_row.keys())):
-                print(f"  {i+1:2d}. {col_name}")
+        if self._columns:
+            logger.debug("Sample columns (%d):", len(self._columns))
+            for i, col_name in enumerate(sorted(self._columns)):
+                logger.debug("  %2d. %s", i + 1, col_name)
                 if i >= 10:  # Limit output
-                    print(f"  ... and {len(sample_row) - 11} more columns")
+                    logger.debug("  ... and %d more columns", len(self._columns) - 11)
                     break
     
-    def to_excel(self, output_path: Optional[str] = None) -> str:
+    def _get_column(self, col_name: str) -> List[str]:
+        """Return the value list of a column, creating it if needed"""
+        values = self._columns.get(col_name)
+        if values is None:
+            values = self._columns[col_name] = []
+        return values
+    
+    def to_excel(self, output_path: Optional[str] = None, engine: str = 'xlsxwriter') -> str:
         """
         Convert parsed data to Excel format
         
         Args:
             output_path: Path for output Excel file (optional)
+            engine: Excel writer to use, 'xlsxwriter' (default, falls back to
+                openpyxl on failure) or 'openpyxl'
             
         Returns:
             Path to the created Excel file
         """
-        if not self.terms_data:
-            print("No terminology data found. Please run parse_tbx() first.")
+        if not self._nrows:
+            logger.warning("No terminology data found. Please run parse_tbx() first.")
             return ""
         
-        print(f"Converting {len(self.terms_data)} rows to Excel...")
+        logger.info("Converting %d rows to Excel...", self._nrows)
         
-        # Create DataFrame
-        df = pd.DataFrame(self.terms_data)
-        print(f"Original columns: {list(df.columns)}")
+        column_names = list(self._columns)
+        logger.debug("Original columns: %s", column_names)
         
         # Apply field name mappings (rename columns) - FIXED VERSION
         if self.field_mappings:
-            print(f"Applying field mappings: {self.field_mappings}")
+            logger.debug("Applying field mappings: %s", self.field_mappings)
             
-            # Create a proper rename dictionary
-            rename_dict = {}
+            # Only fields that were actually renamed need a lookup
+            renamed_fields = {
+                original: new for original, new in self.field_mappings.items()
+                if original != new
+            }
             
-            for current_col in df.columns:
-                new_name = None
-                
+            for i, current_col in enumerate(column_names):
                 # Check for language-prefixed columns (e.g., "de_term", "en_termNote_status", "de_term_2")
-                if '_' in current_col:
-                    # Handle columns with term numbers (e.g., "de_term_2")
-                    parts = current_col.split('_')
-                    
-                    if len(parts) >= 2:
-                        lang_prefix = parts[0]
-                        
-                        # Check if last part is a number (for multiple terms)
-                        term_number = ""
-                        if len(parts) >= 3 and parts[-1].isdigit():
-                            term_number = f"_{parts[-1]}"
-                            base_field = '_'.join(parts[1:-1])  # Everything between lang and number
-                        else:
-                            base_field = '_'.join(parts[1:])  # Everything after language
-                        
-                        # Check if the base field has a mapping
-                        if base_field in self.field_mappings:
-                            new_name = f"{lang_prefix}_{self.field_mappings[base_field]}{term_number}"
-                        # Check if the full column name has a direct mapping
-                        elif current_col in self.field_mappings:
-                            new_name = self.field_mappings[current_col]
+                match = _COLUMN_NAME_PATTERN.match(current_col)
+                if match and match.group(2) in renamed_fields:
+                    lang_prefix, base_field, term_number = match.groups()
+                    new_name = f"{lang_prefix}_{renamed_fields[base_field]}"
+                    if term_number:
+                        new_name = f"{new_name}_{term_number}"
+                    column_names[i] = new_name
                 
                 # Check for direct mapping (non-language-prefixed columns)
-                if new_name is None and current_col in self.field_mappings:
-                    new_name = self.field_mappings[current_col]
-                
-                # Use the new name if found, otherwise keep original
-                if new_name:
-                    rename_dict[current_col] = new_name
-                    print(f"  Renaming: '{current_col}' → '{new_name}'")
-                else:
-                    rename_dict[current_col] = current_col
-                    print(f"  Keeping: '{current_col}'")
+                elif current_col in renamed_fields:
+                    column_names[i] = renamed_fields[current_col]
             
-            # Apply the renaming
-            df = df.rename(columns=rename_dict)
-            print(f"Final columns after renaming: {list(df.columns)}")
+            logger.debug("Final columns after renaming: %s", column_names)
+        
+        # The writers silently drop cells beyond the sheet limits, so refuse
+        # to write a truncated sheet
+        if len(column_names) > _EXCEL_MAX_COLUMNS or self._nrows + 1 > _EXCEL_MAX_ROWS:
+            logger.error("✗ Error writing Excel file: %d rows x %d columns (including the header) "
+                         "exceed the Excel sheet limit of %d rows x %d columns",
+                         self._nrows + 1, len(column_names), _EXCEL_MAX_ROWS, _EXCEL_MAX_COLUMNS)
+            return ""
         
         # Generate output filename if not provided
         if not output_path:
@@ -621,82 +726,132 @@ class TBXConverter:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Write to Excel
-        try:
-            print(f"Writing Excel file to: {output_path}")
-            
-            # Use xlsxwriter engine for better compatibility
-            with pd.ExcelWriter(str(output_path), engine='xlsxwriter') as writer:
-                df.to_excel(writer, sheet_name='Terminology', index=False)
-                
-                # Get the workbook and worksheet objects
-                workbook = writer.book
-                worksheet = writer.sheets['Terminology']
-                
-                # Auto-adjust column widths
-                for i, column in enumerate(df.columns):
-                    # Calculate the maximum length in the column
-                    max_length = len(str(column))  # Header length
-                    for value in df[column].astype(str):
-                        max_length = max(max_length, len(value))
-                    
-                    # Set width with some padding, but cap at reasonable maximum
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.set_column(i, i, adjusted_width)
-            
-            # Verify file was created
-            if output_path.exists():
-                file_size = output_path.stat().st_size
-                print(f"✓ Successfully converted TBX to Excel: {output_path}")
-                print(f"✓ File size: {file_size:,} bytes")
-                print(f"✓ Total entries: {len(df)}")
-                print(f"✓ Columns: {len(df.columns)}")
-            else:
-                print("✗ Error: Excel file was not created")
+        if engine == 'openpyxl':
+            try:
+                logger.info("Writing Excel file with openpyxl to: %s", output_path)
+                self._write_openpyxl(output_path, column_names)
+            except Exception as e:
+                logger.error("✗ Error writing Excel file: %s", e)
+                logger.error("Error type: %s", type(e).__name__)
                 return ""
-            
-            return str(output_path)
-            
-        except Exception as e:
-            print(f"✗ Error writing Excel file: {e}")
-            print(f"Error type: {type(e).__name__}")
-            
-            # Try alternative approach with openpyxl
+        else:
             try:
-                print("Trying alternative Excel writer (openpyxl)...")
-                with pd.ExcelWriter(str(output_path), engine='openpyxl') as writer:
-                    df.to_excel(writer, sheet_name='Terminology', index=False)
-                
-                if output_path.exists():
-                    print(f"✓ Successfully created Excel file with openpyxl: {output_path}")
-                    return str(output_path)
-                else:
-                    print("✗ Failed to create file with openpyxl as well")
-                    
-            except Exception as e2:
-                print(f"✗ Alternative Excel writer also failed: {e2}")
+                logger.info("Writing Excel file to: %s", output_path)
+                self._write_xlsxwriter(output_path, column_names)
+            except Exception as e:
+                logger.error("✗ Error writing Excel file: %s", e)
+                logger.error("Error type: %s", type(e).__name__)
                 
+                # Try alternative approach with openpyxl
+                try:
+                    logger.info("Trying alternative Excel writer (openpyxl)...")
+                    self._write_openpyxl(output_path, column_names)
+                except Exception as e2:
+                    logger.error("✗ Alternative Excel writer also failed: %s", e2)
+                    return ""
+        
+        # Verify file was created
+        if output_path.exists():
+            file_size = output_path.stat().st_size
+            logger.info("✓ Successfully converted TBX to Excel: %s", output_path)
+            logger.info("✓ File size: %s bytes", f"{file_size:,}")
+            logger.info("✓ Total entries: %d", self._nrows)
+            logger.info("✓ Columns: %d", len(column_names))
+        else:
+            logger.error("✗ Error: Excel file was not created")
             return ""
+        
+        return str(output_path)
+    
+    def _write_xlsxwriter(self, output_path: Path, column_names: List[str]):
+        """Write the parsed columns to an Excel file with xlsxwriter"""
+        # Write rows straight from the column lists. constant_memory flushes
+        # each row to disk as it is written, so memory use stays flat however
+        # many rows there are.
+        import xlsxwriter
+        
+        # Every value is text: terms such as "=click" must not be turned into formulas
+        workbook = xlsxwriter.Workbook(str(output_path), {
+            'constant_memory': True,
+            'strings_to_urls': False,
+            'strings_to_formulas': False,
+        })
+        try:
+            worksheet = workbook.add_worksheet('Terminology')
+            header_format = workbook.add_format({'bold': True, 'border': 1,
+                                                 'align': 'center', 'valign': 'top'})
+            
+            # Auto-adjust column widths: the maximum length in each column
+            # (including the header), with some padding but capped at a
+            # reasonable maximum
+            for i, (column, values) in enumerate(zip(column_names, self._columns.values())):
+                max_length = max(len(column), max(map(len, values), default=0))
+                worksheet.set_column(i, i, min(max_length + 2, 50))
+            
+            worksheet.write_row(0, 0, column_names, header_format)
+            
+            # Most cells of a wide export are empty: write only the values,
+            # with write_string to skip write()'s per-cell type dispatch
+            write_string = worksheet.write_string
+            for row_idx, row in enumerate(zip(*self._columns.values()), start=1):
+                for col_idx, value in enumerate(row):
+                    if value:
+                        write_string(row_idx, col_idx, value)
+        finally:
+            workbook.close()
+    
+    def _write_openpyxl(self, output_path: Path, column_names: List[str]):
+        """Write the parsed columns to an Excel file with openpyxl"""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, Side
+        from openpyxl.utils import get_column_letter
+        
+        # Write-only mode streams rows out instead of building a cell object
+        # for every value
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Terminology')
+        
+        for i, (column, values) in enumerate(zip(column_names, self._columns.values()), start=1):
+            max_length = max(len(column), max(map(len, values), default=0))
+            worksheet.column_dimensions[get_column_letter(i)].width = min(max_length + 2, 50)
+        
+        thin = Side(style='thin')
+        header = []
+        for column in column_names:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.font = Font(bold=True)
+            cell.border = Border(left=thin, right=thin, top=thin, bottom=thin)
+            cell.alignment = Alignment(horizontal='center', vertical='top')
+            header.append(cell)
+        worksheet.append(header)
+        
+        # Every value is text: openpyxl would store strings starting with "="
+        # (e.g. the term "=click") as formulas, so write those as string cells
+        def text_cell(value: str) -> WriteOnlyCell:
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.data_type = 's'
+            return cell
+        
+        append = worksheet.append
+        for row in zip(*self._columns.values()):
+            if any(value.startswith('=') for value in row):
+                row = [text_cell(value) if value.startswith('=') else value for value in row]
+            append(row)
+        
+        workbook.save(str(output_path))
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics of the converted data"""
-        if not self.terms_data:
+        if not self._nrows:
             return {}
         
-        df = pd.DataFrame(self.terms_data)
-        
         summary = {
-            'total_entries': len(df),
-            'columns': list(df.columns),
-            'languages_detected': [],
+            'total_entries': self._nrows,
+            'columns': list(self._columns),
+            'languages_detected': list(self.languages_seen),
         }
         
-        # Detect languages from column names
-        for col in df.columns:
-            if '_' in col and not col.startswith('entry_'):
-                lang = col.split('_')[0]
-                if lang not in summary['languages_detected']:
-                    summary['languages_detected'].append(lang)
-        
         return summary
 
 
@@ -709,11 +864,18 @@ def main():
                        help='Show summary statistics')
     parser.add_argument('--auto', action='store_true',
                        help='Skip interactive configuration and use all fields')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                       help='Show detailed progress for every entry and term')
+    parser.add_argument('--engine', choices=['xlsxwriter', 'openpyxl'], default='xlsxwriter',
+                       help='Excel writer to use (default: xlsxwriter)')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(message)s', stream=sys.stdout)
+    
     # Validate input file exists
-    if not Path(args.input_file).exists():
+    if not os.path.isfile(args.input_file):
         print(f"Error: Input file '{args.input_file}' not found.")
         sys.exit(1)
     
@@ -725,7 +887,7 @@ def main():
     if args.auto:
         print("Auto mode: using all available fields with original names")
         converter._scan_available_fields()
-        converter.selected_fields = sorted(list(converter.available_fields))
+        converter.selected_fields = sorted(converter.available_fields)
         converter.field_mappings = {field: field for field in converter.selected_fields}
     else:
         # Interactive configuration
@@ -736,30 +898,33 @@ def main():
     # Parse TBX file
     converter.parse_tbx()
     
-    if not converter.terms_data:
+    if not converter._nrows:
         print("Error: No data was extracted from the TBX file.")
         sys.exit(1)
     
     # Convert to Excel
-    output_file = converter.to_excel(args.output)
+    output_file = converter.to_excel(args.output, engine=args.engine)
     
     if not output_file:
         print("Error: Failed to create Excel file.")
         sys.exit(1)
     
     # Show summary if requested
-    if args.summary or not args.auto:
+    if args.summary:
         summary = converter.get_summary()
-        print(f"\n" + "="*60)
-        print(f"CONVERSION SUMMARY")
-        print(f"="*60)
-        print(f"Total entries: {summary.get('total_entries', 0)}")
-        print(f"Languages detected: {', '.join(summary.get('languages_detected', []))}")
-        print(f"Final columns: {len(summary.get('columns', []))}")
-        if summary.get('columns'):
-            print("Column names:")
-            for col in summary.get('columns', []):
-                print(f"  - {col}")
+        columns = summary.get('columns', [])
+        lines = [
+            "\n" + "="*60,
+            "CONVERSION SUMMARY",
+            "="*60,
+            f"Total entries: {summary.get('total_entries', 0)}",
+            f"Languages detected: {', '.join(summary.get('languages_detected', []))}",
+            f"Final columns: {len(columns)}",
+        ]
+        if columns:
+            lines.append("Column names:")
+            lines.extend(f"  - {col}" for col in columns)
+        print('\n'.join(lines))
     
     return output_file
 